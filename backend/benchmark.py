@@ -6,6 +6,7 @@ import logging
 import time
 from dotenv import load_dotenv
 from service import VerificationService
+from clients import ServiceProvider
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -22,6 +23,10 @@ async def run_benchmark(pdf_path: str):
     with open(pdf_path, "rb") as f:
         file_bytes = f.read()
     
+    warm_start = time.time()
+    timings = await ServiceProvider.warm_up()
+    print(f"🔥 Warm-up took {time.time() - warm_start:.2f}s ({', '.join(f'{k}: {v:.2f}s' for k, v in timings.items())})")
+
     start_time = time.time()
     
     print("Step 1: Running E2E Verification (Check logs for Cache hits)...")
@@ -1,23 +1,75 @@
 import os
+import time
+import asyncio
+import logging
 from typing import Optional
+import httpx
 from tavily import AsyncTavilyClient
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 import redis.asyncio as redis
 
+logger = logging.getLogger(__name__)
+
+# Verifications hit each upstream in bursts of a dozen calls, so keep sockets alive between them
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=120.0)
+# A full pool makes callers wait this long for a free connection instead of failing outright
+REDIS_MAX_CONNECTIONS = 50
+REDIS_POOL_TIMEOUT = 10.0
+WARM_UP_TIMEOUT = 5.0
+
+
+class PooledTavilyClient(AsyncTavilyClient):
+    """AsyncTavilyClient with our pool limits and a warm-up probe.
+
+    The SDK builds its httpx client internally with no hook for limits, so it is
+    rebuilt here with the same headers, base URL and proxy settings.
+    """
+
+    def __init__(self, api_key: str, limits: httpx.Limits):
+        super().__init__(api_key=api_key)
+        proxies = {
+            scheme: os.getenv(var)
+            for scheme, var in (("http://", "TAVILY_HTTP_PROXY"), ("https://", "TAVILY_HTTPS_PROXY"))
+            if os.getenv(var)
+        }
+        # The SDK's own client never sends a request, but still owns a pool until closed
+        self._sdk_client: Optional[httpx.AsyncClient] = self._client
+        self._client = httpx.AsyncClient(
+            headers=self._sdk_client.headers,
+            base_url=self._sdk_client.base_url,
+            limits=limits,
+            mounts={scheme: httpx.AsyncHTTPTransport(proxy=url, limits=limits) for scheme, url in proxies.items()} or None,
+        )
+
+    async def _release_sdk_client(self):
+        if self._sdk_client is not None:
+            await self._sdk_client.aclose()
+            self._sdk_client = None
+
+    async def warm_up(self):
+        await self._release_sdk_client()
+        # Any response will do: the point is the TCP and TLS handshake, and this costs no credits
+        await self._client.head("/")
+
+    async def close(self):
+        await self._release_sdk_client()
+        await super().close()
+
+
 class ServiceProvider:
     """Provides singleton-like access to shared service clients."""
     
-    _tavily_client: Optional[AsyncTavilyClient] = None
+    _tavily_client: Optional[PooledTavilyClient] = None
     _openai_client: Optional[AsyncOpenAI] = None
     _redis_client: Optional[redis.Redis] = None
 
     @classmethod
-    def get_tavily(cls) -> AsyncTavilyClient:
+    def get_tavily(cls) -> PooledTavilyClient:
         if cls._tavily_client is None:
             api_key = os.getenv("TAVILY_API_KEY")
             if not api_key:
                 raise RuntimeError("TAVILY_API_KEY is not set")
-            cls._tavily_client = AsyncTavilyClient(api_key=api_key)
+            cls._tavily_client = PooledTavilyClient(api_key=api_key, limits=HTTP_LIMITS)
         return cls._tavily_client
 
     @classmethod
@@ -30,6 +82,7 @@ class ServiceProvider:
                 api_key=api_key,
                 base_url=os.getenv("OPENAI_BASE_URL", "https://api.deepseek.com"),
                 timeout=60.0,
+                http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS),
             )
         return cls._openai_client
 
@@ -39,5 +92,47 @@ class ServiceProvider:
             redis_url = os.getenv("REDIS_URL")
             if not redis_url:
                 raise RuntimeError("REDIS_URL is not set")
-            cls._redis_client = redis.from_url(redis_url, decode_responses=True)
+            pool = redis.BlockingConnectionPool.from_url(
+                redis_url,
+                decode_responses=True,
+                max_connections=REDIS_MAX_CONNECTIONS,
+                timeout=REDIS_POOL_TIMEOUT,
+                socket_keepalive=True,
+                health_check_interval=30,
+            )
+            cls._redis_client = redis.Redis.from_pool(pool)
         return cls._redis_client
+
+    @classmethod
+    async def warm_up(cls) -> dict[str, float]:
+        """Creates every client and opens a pooled connection to each upstream.
+
+        Returns seconds spent per upstream; failures are logged, not raised, and each
+        probe is capped at WARM_UP_TIMEOUT so a slow dependency cannot stall startup.
+        """
+        async def timed(name: str, probe) -> tuple[str, float]:
+            start = time.perf_counter()
+            try:
+                await asyncio.wait_for(probe(), WARM_UP_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"Warm-up for {name} failed: {e}")
+            return name, time.perf_counter() - start
+
+        timings = await asyncio.gather(
+            timed("redis", lambda: cls.get_redis().ping()),
+            timed("openai", lambda: cls.get_openai().with_options(max_retries=0).models.list()),
+            timed("tavily", lambda: cls.get_tavily().warm_up()),
+        )
+        return dict(timings)
+
+    @classmethod
+    async def close(cls):
+        if cls._tavily_client is not None:
+            await cls._tavily_client.close()
+        if cls._openai_client is not None:
+            await cls._openai_client.close()
+        if cls._redis_client is not None:
+            await cls._redis_client.aclose()
+        cls._tavily_client = None
+        cls._openai_client = None
+        cls._redis_client = None
@@ -0,0 +1,99 @@
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_VERIFY_BUDGET = 45.0
+# Until an upstream has enough samples for a p95 (samples are per process, so every
+# restart starts cold), hedge after this share of the time left, capped at the max
+HEDGE_COLD_SHARE = 0.25
+HEDGE_COLD_MAX_DELAY = 10.0
+HEDGE_MIN_SAMPLES = 20
+HEDGE_WINDOW = 200
+
+
+class Deadline:
+    """Wall-clock budget for one verification, passed down to every external call."""
+
+    def __init__(self, budget: float):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    @classmethod
+    def for_verification(cls) -> "Deadline":
+        return cls(float(os.getenv("VERIFY_BUDGET_SECONDS", DEFAULT_VERIFY_BUDGET)))
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def stage(self, share: float) -> "Deadline":
+        """Sub-budget worth `share` of the total, never outliving the parent."""
+        return Deadline(min(self.budget * share, self.remaining()))
+
+
+class HedgePolicy:
+    """Tracks recent upstream latencies to decide when to fire a hedged duplicate."""
+
+    _samples: dict[str, deque[float]] = {}
+
+    @classmethod
+    def record(cls, upstream: str, seconds: float):
+        cls._samples.setdefault(upstream, deque(maxlen=HEDGE_WINDOW)).append(seconds)
+
+    @classmethod
+    def delay(cls, upstream: str, deadline: Deadline) -> float:
+        samples = cls._samples.get(upstream)
+        if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+            return min(deadline.remaining() * HEDGE_COLD_SHARE, HEDGE_COLD_MAX_DELAY)
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+
+
+async def hedged(upstream: str, call: Callable[[], Awaitable[T]], deadline: Deadline) -> T:
+    """Run `call`, firing one duplicate after the upstream's p95 delay; first success wins.
+
+    The duplicate only covers a slow attempt, never a failed one: errors are raised
+    as-is, leaving retries to the SDK. Raises TimeoutError if the deadline runs out
+    before any attempt succeeds.
+    """
+    started = time.monotonic()
+    hedge_at = started + HedgePolicy.delay(upstream, deadline)
+    hedge_fired = False
+    last_error: Exception | None = None
+    pending = {asyncio.ensure_future(call())}
+
+    try:
+        while pending:
+            remaining = deadline.remaining()
+            if remaining <= 0:
+                break
+            timeout = remaining if hedge_fired else min(remaining, max(hedge_at - time.monotonic(), 0.0))
+            done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in done:
+                if task.exception() is None:
+                    HedgePolicy.record(upstream, time.monotonic() - started)
+                    return task.result()
+                last_error = task.exception()
+
+            if not hedge_fired and pending and time.monotonic() >= hedge_at and not deadline.expired:
+                logger.info(f"Hedging {upstream} call after {time.monotonic() - started:.2f}s")
+                hedge_fired = True
+                pending.add(asyncio.ensure_future(call()))
+    finally:
+        for task in pending:
+            task.cancel()
+
+    if last_error is not None and not deadline.expired:
+        raise last_error
+    raise TimeoutError(f"{upstream} call exceeded its deadline")
@@ -5,6 +5,7 @@ import re
 from typing import Optional
 from openai import AsyncOpenAI
 from models import Claim, ClaimCategory
+from deadline import Deadline, hedged
 
 logger = logging.getLogger(__name__)
 
@@ -51,17 +52,17 @@ def _clean_llm_json(content: str) -> str:
     return content
 
 
-async def extract_claims(resume_text: str, client: AsyncOpenAI) -> tuple[str, str, list[str], list[Claim]]:
+async def extract_claims(resume_text: str, client: AsyncOpenAI, deadline: Deadline) -> tuple[str, str, list[str], list[Claim]]:
     truncated = resume_text[:6000]
     
-    response = await client.chat.completions.create(
+    response = await hedged("deepseek-extract", lambda: client.chat.completions.create(
         model="deepseek-chat",
         messages=[
             {"role": "system", "content": "You extract names, social links (URLs), and professional claims from resumes. return valid JSON only."},
             {"role": "user", "content": EXTRACTION_PROMPT.format(resume_text=truncated)},
         ],
         temperature=0.1,
-    )
+    ), deadline)
 
     content = _clean_llm_json(response.choices[0].message.content)
     
@@ -1,14 +1,44 @@
+import time
+
+MODULE_LOAD_START = time.perf_counter()
+
+import os
+import sys
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sse_starlette.sse import EventSourceResponse
 from service import VerificationService
+from planner import SearchMetrics
+from clients import ServiceProvider
+import parser
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Resume Verifier API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    warm_start = time.perf_counter()
+    timings, _ = await asyncio.gather(
+        ServiceProvider.warm_up(),
+        asyncio.to_thread(parser.preload),
+    )
+    app.state.startup = {
+        "import_seconds": round(warm_start - MODULE_LOAD_START, 3),
+        "warm_up_seconds": {name: round(t, 3) for name, t in timings.items()},
+        "startup_seconds": round(time.perf_counter() - MODULE_LOAD_START, 3),
+        "first_request_seconds": None,
+    }
+    logger.info(f"Worker {os.getpid()} ready: {app.state.startup}")
+    yield
+    await ServiceProvider.close()
+
+
+app = FastAPI(title="Resume Verifier API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -19,6 +49,7 @@ app.add_middleware(
 )
 
 
+DEFAULT_WORKERS = 2
 ALLOWED_EXTENSIONS = {"pdf", "docx", "doc"}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
@@ -28,6 +59,28 @@ async def health():
     return {"success": True, "message": "Resume Verifier API is running"}
 
 
+@app.get("/api/metrics")
+async def metrics():
+    return {"success": True, "search": SearchMetrics.snapshot(), "startup": app.state.startup}
+
+
+async def _track_first_request(events):
+    """Records how long this worker's first non-cached verification took.
+
+    Cache replays never emit progress events, so they are skipped. A client that
+    disconnects early still records the time up to the disconnect.
+    """
+    start = time.perf_counter()
+    cold_run = False
+    try:
+        async for event in events:
+            cold_run = cold_run or event["event"] == "progress"
+            yield event
+    finally:
+        if cold_run and app.state.startup["first_request_seconds"] is None:
+            app.state.startup["first_request_seconds"] = round(time.perf_counter() - start, 3)
+
+
 @app.post("/api/verify")
 async def verify_resume(file: UploadFile = File(...)):
     if not file.filename:
@@ -45,11 +98,24 @@ async def verify_resume(file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail="File too large. Max 10MB.")
 
     return EventSourceResponse(
-        VerificationService.run_verification(file_bytes, file.filename),
+        _track_first_request(VerificationService.run_verification(file_bytes, file.filename)),
         ping=10
     )
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+
+    if "--prod" in sys.argv:
+        # Each worker runs the lifespan hook, so every process starts with warm pools
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=int(os.getenv("PORT", "8000")),
+            # os.cpu_count() reports the host's cores inside containers, not the CPU quota
+            workers=int(os.getenv("WEB_CONCURRENCY", DEFAULT_WORKERS)),
+            timeout_keep_alive=30,
+            log_level="info",
+        )
+    else:
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
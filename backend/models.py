@@ -31,6 +31,7 @@ class ClaimResult(BaseModel):
     score: int = Field(ge=0, le=100)
     evidence: list[Evidence] = []
     explanation: str = ""
+    degraded: bool = False
 
 
 class VerificationResponse(BaseModel):
@@ -41,3 +42,4 @@ class VerificationResponse(BaseModel):
     first_name: str = ""
     last_name: str = ""
     social_links: list[str] = []
+    degraded: bool = False
@@ -1,8 +1,12 @@
-import pdfplumber
-from docx import Document
 import io
 
 
+def preload():
+    """Imports the parser backends ahead of the first upload; they are slow to load."""
+    import pdfplumber  # noqa: F401
+    import docx  # noqa: F401
+
+
 def extract_text(file_bytes: bytes, filename: str) -> str:
     ext = filename.lower().rsplit(".", 1)[-1] if "." in filename else ""
 
@@ -15,6 +19,8 @@ def extract_text(file_bytes: bytes, filename: str) -> str:
 
 
 def _extract_pdf(file_bytes: bytes) -> str:
+    import pdfplumber
+
     text_parts = []
     with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
         for page in pdf.pages:
@@ -25,6 +31,8 @@ def _extract_pdf(file_bytes: bytes) -> str:
 
 
 def _extract_docx(file_bytes: bytes) -> str:
+    from docx import Document
+
     doc = Document(io.BytesIO(file_bytes))
     text_parts = []
     for para in doc.paragraphs:
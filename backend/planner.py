@@ -0,0 +1,211 @@
+import re
+from typing import Optional
+from urllib.parse import urlparse
+from pydantic import BaseModel
+from models import Claim
+
+MAX_CLAIMS_PER_QUERY = 4
+MAX_QUERY_LENGTH = 380  # Tavily rejects queries over 400 characters
+MAX_RESULTS = 20
+
+STOPWORDS = {
+    "the", "and", "for", "from", "with", "at", "in", "of", "on", "to", "as", "by",
+    "was", "were", "has", "have", "had", "his", "her", "their", "worked", "working",
+    "years", "year", "present", "current", "currently",
+}
+
+# Capitalised words after a preposition, allowing connectors as in "University of Lagos"
+ENTITY_PATTERN = re.compile(r"\b(?:at|from|with|for|by)\s+([A-Z][\w&.'-]*(?:\s+(?:(?:of|and|&)\s+)?[A-Z][\w&.'-]*){0,4})")
+
+
+class QueryGroup(BaseModel):
+    key: str
+    claims: list[Claim]
+    query: str
+    max_results: int
+    include_domains: Optional[list[str]] = None
+    # The candidate's own profile (domain, path); pages under it back every claim in the group
+    profile: Optional[tuple[str, str]] = None
+
+
+class SearchMetrics:
+    """Running totals of Tavily calls made by the planner vs one-query-per-claim.
+
+    Only primary queries are compared: the naive path sends exactly one per uncached
+    claim. Fallback calls are reported on their own, because how many claims would have
+    needed a fallback without merging can't be observed from a planned run.
+    """
+
+    _resumes: int = 0
+    _primary_calls: int = 0
+    _fallback_calls: int = 0
+    _naive_primary_calls: int = 0
+
+    @classmethod
+    def record(cls, primary: int, fallback: int, naive_primary: int):
+        cls._resumes += 1
+        cls._primary_calls += primary
+        cls._fallback_calls += fallback
+        cls._naive_primary_calls += naive_primary
+
+    @classmethod
+    def snapshot(cls) -> dict:
+        return {
+            "resumes": cls._resumes,
+            "primary_calls": cls._primary_calls,
+            "naive_primary_calls": cls._naive_primary_calls,
+            "primary_calls_saved": cls._naive_primary_calls - cls._primary_calls,
+            "fallback_calls": cls._fallback_calls,
+        }
+
+
+def name_variants(first_name: str, last_name: str, social_links: list[str]) -> set[str]:
+    names = {f"{first_name} {last_name}"}
+    for link in social_links:
+        parsed = urlparse(link.lower())
+        path = parsed.path.strip("/")
+        if path:
+            # Handle forms like /in/mofeoluwa or just /mofeoluwa
+            handle = path.split("/")[-1]
+            if len(handle) > 3 and handle not in names:
+                # Add handle + last name as a potential variation
+                names.add(f"{handle.capitalize()} {last_name}")
+    return names
+
+
+def social_seed(social_links: list[str]) -> Optional[tuple[str, str]]:
+    """The first social link with both a domain and a path, used to anchor `site:` queries."""
+    for link in social_links:
+        parsed = urlparse(link)
+        path = parsed.path.strip("/")
+        if parsed.netloc and path:
+            return parsed.netloc, path
+    return None
+
+
+def claim_entity(claim: Claim) -> str:
+    match = ENTITY_PATTERN.search(claim.claim)
+    if not match:
+        return ""
+    # "Google." and "Google" must land on the same key
+    return " ".join(re.sub(r"[^\w\s&]", "", match.group(1)).lower().split())
+
+
+def _terms(text: str) -> set[str]:
+    return {t for t in re.findall(r"[a-z0-9+#]+", text.lower()) if len(t) > 2 and t not in STOPWORDS}
+
+
+def _pack(
+    key: str,
+    claims: list[Claim],
+    prefix: str,
+    max_results: int,
+    include_domains: Optional[list[str]],
+    profile: Optional[tuple[str, str]] = None,
+) -> list[QueryGroup]:
+    """Split claims sharing a key into queries that respect the claim and length caps."""
+    groups: list[QueryGroup] = []
+    batch: list[Claim] = []
+
+    def flush():
+        if not batch:
+            return
+        if len(batch) == 1:
+            query = f"{prefix} {batch[0].claim}"
+        else:
+            query = f"{prefix} " + " OR ".join(f"({c.claim})" for c in batch)
+        groups.append(QueryGroup(
+            key=key,
+            claims=list(batch),
+            query=query[:MAX_QUERY_LENGTH],
+            max_results=max_results if len(batch) == 1 else MAX_RESULTS,
+            include_domains=include_domains,
+            profile=profile,
+        ))
+        batch.clear()
+
+    for claim in claims:
+        candidate = batch + [claim]
+        length = len(prefix) + sum(len(c.claim) + 6 for c in candidate)
+        if batch and (len(candidate) > MAX_CLAIMS_PER_QUERY or length > MAX_QUERY_LENGTH):
+            flush()
+        batch.append(claim)
+    flush()
+    return groups
+
+
+def plan_primary(claims: list[Claim], names: set[str], social_links: list[str]) -> list[QueryGroup]:
+    """Primary queries: one `site:` query per profile domain, or broad queries when there is no profile."""
+    include_domains = [urlparse(l).netloc for l in social_links if l] or None
+    seed = social_seed(social_links)
+    if seed is None:
+        # Links without a path (e.g. a personal site) still scope the search to those domains
+        return plan_broad(claims, names, max_results=15, include_domains=include_domains)
+
+    domain, path = seed
+    # Keep claims about the same employer or school in the same query
+    ordered = sorted(claims, key=claim_entity)
+    return _pack(domain, ordered, f"site:{domain} \"{path}\"", 15, include_domains, profile=seed)
+
+
+def plan_broad(
+    claims: list[Claim],
+    names: set[str],
+    max_results: int = 10,
+    include_domains: Optional[list[str]] = None,
+) -> list[QueryGroup]:
+    """Name-anchored queries, merging only claims that share an entity."""
+    name_clause = " OR ".join([f'"{n}"' for n in names])
+    prefix = f"({name_clause})"
+
+    by_entity: dict[str, list[Claim]] = {}
+    groups: list[QueryGroup] = []
+    for claim in claims:
+        entity = claim_entity(claim)
+        if entity:
+            by_entity.setdefault(entity, []).append(claim)
+        else:
+            groups.extend(_pack(claim.claim, [claim], prefix, max_results, include_domains))
+
+    for entity, members in by_entity.items():
+        groups.extend(_pack(entity, members, prefix, max_results, include_domains))
+    return groups
+
+
+def _on_profile(url: str, profile: tuple[str, str]) -> bool:
+    """Same test as the scorer's mirror match: the profile's domain and a path under it."""
+    domain, path = profile
+    parsed = urlparse(url.lower())
+    domain_parts = domain.lower().split(".")
+    main_domain = ".".join(domain_parts[-2:])
+    return main_domain in parsed.netloc and parsed.path.strip("/").startswith(path.lower())
+
+
+def assign_results(group: QueryGroup, results: list[dict]) -> dict[str, list[dict]]:
+    """Hand each result of a combined query back to the claims whose terms it mentions.
+
+    Pages on the candidate's own profile go to every claim, as each claim's separate
+    `site:` query would have returned them. Ties for the best match go to every tied claim.
+    """
+    assigned: dict[str, list[dict]] = {c.claim: [] for c in group.claims}
+    if len(group.claims) == 1:
+        assigned[group.claims[0].claim] = list(results)
+        return assigned
+
+    terms = {c.claim: _terms(c.claim) for c in group.claims}
+    for result in results:
+        if group.profile and _on_profile(result.get("url", ""), group.profile):
+            for claim in assigned:
+                assigned[claim].append(result)
+            continue
+
+        found = _terms(f"{result.get('title', '')} {result.get('content', '')}")
+        hits = {claim: len(wanted & found) for claim, wanted in terms.items()}
+
+        matched = [claim for claim, count in hits.items() if count >= min(2, len(terms[claim])) and count > 0]
+        if not matched:
+            best = max(hits.values())
+            matched = [claim for claim, count in hits.items() if count == best] if best > 0 else []
+        for claim in matched:
+            assigned[claim].append(result)
+    return assigned
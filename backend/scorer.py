@@ -7,6 +7,7 @@ from urllib.parse import urlparse
 from openai import AsyncOpenAI
 from models import Claim, Evidence, ClaimResult
 from cache import CacheService
+from deadline import Deadline, hedged
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,8 @@ async def score_single_claim(
     first_name: str,
     last_name: str,
     social_links: list[str],
-    client: AsyncOpenAI
+    client: AsyncOpenAI,
+    deadline: Deadline
 ) -> ClaimResult:
     score_hash = CacheService.generate_hash(claim.claim, first_name, last_name, "".join([e.url for e in evidence_list]))
     cached_score = await CacheService.get_claim_result(score_hash)
@@ -36,19 +38,21 @@ async def score_single_claim(
     }
 
     try:
-        response = await client.chat.completions.create(
+        response = await hedged("deepseek-score", lambda: client.chat.completions.create(
             model="deepseek-chat",
             messages=[
                 {"role": "system", "content": f"You are a professional fact-checker. Current date: {current_date}. Verify if {full_name} is linked to the claim. Finding Name + Entity in a professional profile is worth 30+ points."},
                 {"role": "user", "content": f"Assess this claim for {full_name}:\n{json.dumps(context, indent=2)}\n\nBase Scoring (0-70):\n- 0: NOISE (Category mismatch or absolute nonsense)\n- 1-25: WEAK (Entity found but name is missing or ambiguous in snippet)\n- 26-45: PLAUSIBLE (Name and Entity both present in a professional context)\n- 46-70: CONFIRMED (Verified by independent news, govt, or company registries)\n\nReturn JSON: {{\"base_score\": int, \"explanation\": \"short reason\"}}"},
             ],
             temperature=0.1,
-        )
+        ), deadline)
         content = re.sub(r'^```(?:json)?\s*\n?|\n?```\s*$', '', response.choices[0].message.content.strip())
         if not content.startswith('{'):
             content = re.search(r'\{.*\}', content, re.DOTALL).group(0)
         
         score_data = json.loads(content)
+    except TimeoutError:
+        return degraded_result(claim, evidence_list, "scoring")
     except Exception as e:
         logger.error(f"Scoring error: {e}")
         score_data = {"base_score": 5, "explanation": "Verification stalls."}
@@ -120,6 +124,19 @@ async def score_single_claim(
     return res
 
 
+def degraded_result(claim: Claim, evidence_list: list[Evidence], stage: str) -> ClaimResult:
+    """Placeholder for a claim the verification budget ran out on; never cached."""
+    return ClaimResult(
+        claim=claim.claim,
+        category=claim.category,
+        importance=claim.importance,
+        score=0,
+        evidence=evidence_list,
+        explanation=f"DEGRADED: time budget exhausted during {stage}.",
+        degraded=True,
+    )
+
+
 async def score_claims(
     claims: list[Claim],
     evidence_map: dict[str, list[Evidence]],
@@ -136,6 +153,8 @@ async def score_claims(
 
 
 def calculate_overall_score(results: list[ClaimResult]) -> int:
+    # Degraded claims were never assessed, so they don't drag the score down
+    results = [r for r in results if not r.degraded]
     if not results:
         return 0
     total_weight = sum(r.importance for r in results)
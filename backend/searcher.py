@@ -1,94 +1,112 @@
-import os
 import asyncio
-from urllib.parse import urlparse
+import logging
 from tavily import AsyncTavilyClient
 from models import Claim, Evidence
 from cache import CacheService
+from deadline import Deadline, hedged
+from planner import QueryGroup, SearchMetrics, assign_results, name_variants, plan_broad, plan_primary, social_seed
 
+logger = logging.getLogger(__name__)
 
-async def search_single_claim(claim: Claim, first_name: str, last_name: str, social_links: list[str], client: AsyncTavilyClient) -> list[Evidence]:
-    claim_hash = CacheService.generate_hash(claim.claim, first_name, last_name, "".join(social_links))
-    cached_evidence = await CacheService.get_search_evidence(claim_hash)
-    if cached_evidence:
-        return cached_evidence
-
-    formal_name = f"{first_name} {last_name}"
-    names = {formal_name}
-    
-    for link in social_links:
-        parsed = urlparse(link.lower())
-        path = parsed.path.strip("/")
-        if path:
-            # Handle forms like /in/mofeoluwa or just /mofeoluwa
-            handle = path.split("/")[-1]
-            if len(handle) > 3 and handle not in names:
-                # Add handle + last name as a potential variation
-                names.add(f"{handle.capitalize()} {last_name}")
-
-    social_queries = []
-    for link in social_links:
-        parsed = urlparse(link)
-        domain = parsed.netloc
-        path = parsed.path.strip("/")
-        if domain and path:
-            social_queries.append(f"site:{domain} \"{path}\" {claim.claim}")
-    
-    name_clause = " OR ".join([f'"{n}"' for n in names])
-    broad_query = f"({name_clause}) {claim.claim}"
-    
-    primary_query = broad_query
-    if social_queries:
-        primary_query = social_queries[0]
-    
-    try:
-        response = await client.search(
-            query=primary_query,
-            search_depth="advanced",
-            max_results=15,
-            include_domains=[urlparse(l).netloc for l in social_links if l] if social_links else None
-        )
-        
-        results = response.get("results", [])
-        if len(results) < 3 and primary_query != broad_query:
-            extra = await client.search(
-                query=broad_query,
-                search_depth="advanced",
-                max_results=10
-            )
-            results.extend(extra.get("results", []))
-
-        evidence = []
-        seen_urls = set()
-        for result in results:
-            url = result.get("url", "")
-            if url in seen_urls: continue
-            seen_urls.add(url)
-            
-            evidence.append(Evidence(
-                title=result.get("title", ""),
-                url=url,
-                snippet=result.get("content", "")[:500],
-            ))
-        final_evidence = evidence[:10]
-        await CacheService.set_search_evidence(claim_hash, final_evidence)
-        return final_evidence
-    except Exception as e:
-        print(f"Search error: {e}")
-        return []
+
+def _claim_hash(claim: Claim, first_name: str, last_name: str, social_links: list[str]) -> str:
+    return CacheService.generate_hash(claim.claim, first_name, last_name, "".join(social_links))
+
+
+def _to_evidence(results: list[dict]) -> list[Evidence]:
+    evidence = []
+    seen_urls = set()
+    for result in results:
+        url = result.get("url", "")
+        if url in seen_urls: continue
+        seen_urls.add(url)
+
+        evidence.append(Evidence(
+            title=result.get("title", ""),
+            url=url,
+            snippet=result.get("content", "")[:500],
+        ))
+    return evidence[:10]
+
+
+async def search_group(group: QueryGroup, client: AsyncTavilyClient, deadline: Deadline) -> dict[str, list[dict]]:
+    response = await hedged("tavily", lambda: client.search(
+        query=group.query,
+        search_depth="advanced",
+        max_results=group.max_results,
+        include_domains=group.include_domains,
+    ), deadline)
+    return assign_results(group, response.get("results", []))
+
+
+async def _run_plan(groups: list[QueryGroup], client: AsyncTavilyClient, deadline: Deadline) -> tuple[dict[str, list[dict]], set[str]]:
+    """Runs every group concurrently; claims in groups that ran out of budget are returned separately."""
+    outcomes = await asyncio.gather(*[search_group(g, client, deadline) for g in groups], return_exceptions=True)
+
+    results: dict[str, list[dict]] = {}
+    timed_out: set[str] = set()
+    for group, outcome in zip(groups, outcomes):
+        if isinstance(outcome, TimeoutError):
+            timed_out.update(c.claim for c in group.claims)
+        elif isinstance(outcome, Exception):
+            logger.error(f"Search error: {outcome}")
+        else:
+            results.update(outcome)
+    return results, timed_out
 
 
 async def search_all_claims(
-    claims: list[Claim], 
-    first_name: str, 
-    last_name: str, 
+    claims: list[Claim],
+    first_name: str,
+    last_name: str,
     social_links: list[str],
-    client: AsyncTavilyClient
-) -> dict[str, list[Evidence]]:
-    tasks = [search_single_claim(claim, first_name, last_name, social_links, client) for claim in claims]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    client: AsyncTavilyClient,
+    deadline: Deadline
+) -> tuple[dict[str, list[Evidence]], set[str], bool]:
+    """Returns the evidence map, the claims whose search ran out of budget, and
+    whether any claim's evidence is partial (its fallback search failed)."""
+    cached = await asyncio.gather(*[
+        CacheService.get_search_evidence(_claim_hash(claim, first_name, last_name, social_links)) for claim in claims
+    ])
 
     evidence_map: dict[str, list[Evidence]] = {}
-    for claim, result in zip(claims, results):
-        evidence_map[claim.claim] = result if not isinstance(result, Exception) else []
+    pending: list[Claim] = []
+    for claim, cached_evidence in zip(claims, cached):
+        if cached_evidence:
+            evidence_map[claim.claim] = cached_evidence
+        else:
+            pending.append(claim)
+    if not pending:
+        return evidence_map, set(), False
+
+    names = name_variants(first_name, last_name, social_links)
+    primary = plan_primary(pending, names, social_links)
+    results, degraded = await _run_plan(primary, client, deadline)
+
+    # Claims the profile query barely covered fall back to a name search, merged by entity
+    sparse = []
+    if social_seed(social_links):
+        sparse = [c for c in pending if c.claim not in degraded and len(results.get(c.claim, [])) < 3]
+    broad = plan_broad(sparse, names)
+    incomplete: set[str] = set()
+    if broad:
+        extra, _ = await _run_plan(broad, client, deadline)
+        # Keep what the primary query found rather than losing the claim, but don't cache it
+        incomplete = {c.claim for c in sparse if c.claim not in extra}
+        for claim_text, found in extra.items():
+            results.setdefault(claim_text, []).extend(found)
+
+    SearchMetrics.record(primary=len(primary), fallback=len(broad), naive_primary=len(pending))
+    logger.info(f"Search planner: {len(primary)} primary calls (naive: {len(pending)}), {len(broad)} fallback calls")
+
+    writes = []
+    for claim in pending:
+        evidence = _to_evidence(results.get(claim.claim, []))
+        evidence_map[claim.claim] = evidence
+        if claim.claim in results and claim.claim not in incomplete:
+            writes.append(CacheService.set_search_evidence(_claim_hash(claim, first_name, last_name, social_links), evidence))
+    await asyncio.gather(*writes)
 
-    return evidence_map
+    # Claims left uncached above must not be replayed through the full-results cache either
+    partial = any(c.claim not in degraded and (c.claim not in results or c.claim in incomplete) for c in pending)
+    return evidence_map, degraded, partial
@@ -7,17 +7,22 @@ from typing import AsyncGenerator
 from parser import extract_text
 from extractor import extract_claims
 from searcher import search_all_claims
-from scorer import calculate_overall_score, score_single_claim
+from scorer import calculate_overall_score, score_single_claim, degraded_result
 from models import VerificationResponse
 from clients import ServiceProvider
 from cache import CacheService
+from deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
+# Share of the verification budget each stage may spend; scoring gets whatever is left
+STAGE_BUDGETS = {"extracting": 0.4, "searching": 0.3}
+
 class VerificationService:
     @staticmethod
     async def run_verification(file_bytes: bytes, filename: str) -> AsyncGenerator[dict, None]:
         start_time = time.time()
+        deadline = Deadline.for_verification()
         
         file_hash = CacheService.generate_hash(file_bytes)
         cached_res = await CacheService.get_full_results(file_hash)
@@ -51,7 +56,13 @@ class VerificationService:
 
             yield {"event": "progress", "data": json.dumps({"step": "extracting", "message": "Identifying claims..."})}
             step_start = time.time()
-            first_name, last_name, social_links, claims = await extract_claims(resume_text, openai)
+            try:
+                first_name, last_name, social_links, claims = await extract_claims(
+                    resume_text, openai, deadline.stage(STAGE_BUDGETS["extracting"])
+                )
+            except TimeoutError:
+                yield {"event": "error", "data": json.dumps({"message": "Claim extraction timed out."})}
+                return
             if not claims:
                 yield {"event": "error", "data": json.dumps({"message": "No claims found."})}
                 return
@@ -68,21 +79,30 @@ class VerificationService:
 
             yield {"event": "progress", "data": json.dumps({"step": "searching", "message": "Searching web..."})}
             step_start = time.time()
-            evidence_map = await search_all_claims(claims, first_name, last_name, social_links, tavily)
-            logger.info(f"Search took {time.time() - step_start:.2f}s")
+            evidence_map, degraded, incomplete = await search_all_claims(
+                claims, first_name, last_name, social_links, tavily, deadline.stage(STAGE_BUDGETS["searching"])
+            )
+            logger.info(f"Search took {time.time() - step_start:.2f}s ({len(degraded)} claims degraded)")
             yield {"event": "progress", "data": json.dumps({"step": "scoring", "message": "Evaluating evidence..."})}
             step_start = time.time()
             
-            scoring_tasks = [
-                score_single_claim(claim, evidence_map.get(claim.claim, []), first_name, last_name, social_links, openai)
-                for claim in claims
-            ]
-            
             results = []
+            scoring_tasks = []
+            for claim in claims:
+                if claim.claim in degraded:
+                    res = degraded_result(claim, evidence_map.get(claim.claim, []), "search")
+                    results.append(res)
+                    yield {"event": "claim_result", "data": res.model_dump_json()}
+                    continue
+                scoring_tasks.append(
+                    score_single_claim(claim, evidence_map.get(claim.claim, []), first_name, last_name, social_links, openai, deadline)
+                )
+            
             for coro in asyncio.as_completed(scoring_tasks):
                 res = await coro
                 results.append(res)
                 yield {"event": "claim_result", "data": res.model_dump_json()}
+            logger.info(f"Scoring took {time.time() - step_start:.2f}s")
 
             response = VerificationResponse(
                 success=True,
@@ -92,9 +112,12 @@ class VerificationService:
                 first_name=first_name,
                 last_name=last_name,
                 social_links=social_links,
+                degraded=any(r.degraded for r in results),
             )
 
-            await CacheService.set_full_results(file_hash, response.model_dump())
+            # Partial results are served but not replayed, so a re-upload gets a full run
+            if not response.degraded and not incomplete:
+                await CacheService.set_full_results(file_hash, response.model_dump())
             
             yield {"event": "complete", "data": response.model_dump_json()}
             logger.info(f"Total verification took {time.time() - start_time:.2f}s")
@@ -119,7 +119,7 @@ export function ProgressTracker({ currentStep, message, claims, claimResults }:
                                                 }`} />
                                         )}
                                         {c.claim.length > 50 ? c.claim.slice(0, 50) + '…' : c.claim}
-                                        {isScored && <span className="ml-1 opacity-70 font-bold">{result.score}</span>}
+                                        {isScored && <span className="ml-1 opacity-70 font-bold">{result.degraded ? '—' : result.score}</span>}
                                     </span>
                                 );
                             })}
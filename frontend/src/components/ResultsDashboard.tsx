@@ -1,4 +1,4 @@
-import { ExternalLink, ChevronDown, ChevronUp, Shield, ShieldCheck, ShieldAlert } from 'lucide-react';
+import { ExternalLink, ChevronDown, ChevronUp, Shield, ShieldCheck, ShieldAlert, Clock } from 'lucide-react';
 import { useState } from 'react';
 import type { VerificationResponse, ClaimResult } from '../types';
 
@@ -13,6 +13,9 @@ function getScoreColor(score: number) {
     return { text: 'text-danger', bar: 'score-bar-low', bg: 'bg-danger/10' };
 }
 
+// Degraded claims ran out of time before being checked, so they get no score colour
+const DEGRADED_COLORS = { text: 'text-text-muted', bar: '', bg: 'bg-bg-card-hover' };
+
 function getScoreLabel(score: number) {
     if (score >= 80) return 'Strongly Verified';
     if (score >= 65) return 'Verified';
@@ -65,8 +68,8 @@ function ScoreRing({ score, size = 160 }: { score: number; size?: number }) {
 
 function ClaimCard({ result, index }: { result: ClaimResult; index: number }) {
     const [expanded, setExpanded] = useState(false);
-    const colors = getScoreColor(result.score);
-    const Icon = result.score >= 65 ? ShieldCheck : result.score >= 35 ? Shield : ShieldAlert;
+    const colors = result.degraded ? DEGRADED_COLORS : getScoreColor(result.score);
+    const Icon = result.degraded ? Clock : result.score >= 65 ? ShieldCheck : result.score >= 35 ? Shield : ShieldAlert;
 
     return (
         <div
@@ -94,8 +97,8 @@ function ClaimCard({ result, index }: { result: ClaimResult; index: number }) {
                 </div>
                 <div className="flex items-center gap-3 shrink-0">
                     <div className="text-right">
-                        <span className={`text-2xl font-bold ${colors.text}`}>{result.score}</span>
-                        <p className={`text-xs ${colors.text} opacity-80`}>{getScoreLabel(result.score)}</p>
+                        <span className={`text-2xl font-bold ${colors.text}`}>{result.degraded ? '—' : result.score}</span>
+                        <p className={`text-xs ${colors.text} opacity-80`}>{result.degraded ? 'Not Checked' : getScoreLabel(result.score)}</p>
                     </div>
                     {expanded ? <ChevronUp size={16} className="text-text-muted" /> : <ChevronDown size={16} className="text-text-muted" />}
                 </div>
@@ -105,7 +108,7 @@ function ClaimCard({ result, index }: { result: ClaimResult; index: number }) {
             <div className="h-1 bg-bg-card-hover">
                 <div
                     className={`h-full ${colors.bar} transition-all duration-700`}
-                    style={{ width: `${result.score}%` }}
+                    style={{ width: `${result.degraded ? 0 : result.score}%` }}
                 />
             </div>
 
@@ -157,9 +160,11 @@ function ClaimCard({ result, index }: { result: ClaimResult; index: number }) {
 
 export function ResultsDashboard({ data, onReset }: ResultsDashboardProps) {
     const overallColors = getScoreColor(data.overall_score);
-    const verifiedCount = data.claims.filter(c => c.score >= 65).length;
-    const partialCount = data.claims.filter(c => c.score >= 35 && c.score < 65).length;
-    const unverifiedCount = data.claims.filter(c => c.score < 35).length;
+    const checked = data.claims.filter(c => !c.degraded);
+    const verifiedCount = checked.filter(c => c.score >= 65).length;
+    const partialCount = checked.filter(c => c.score >= 35 && c.score < 65).length;
+    const unverifiedCount = checked.filter(c => c.score < 35).length;
+    const notCheckedCount = data.claims.length - checked.length;
 
     return (
         <div className="w-full max-w-3xl mx-auto animate-fade-in">
@@ -173,6 +178,11 @@ export function ResultsDashboard({ data, onReset }: ResultsDashboardProps) {
                     {getScoreLabel(data.overall_score)}
                 </p>
                 <p className="text-text-muted text-sm mt-1">{data.resume_name}</p>
+                {data.degraded && (
+                    <p className="text-text-muted text-xs mt-2">
+                        Some claims could not be checked in time and are excluded from the score.
+                    </p>
+                )}
 
                 {/* Stats row */}
                 <div className="flex justify-center gap-6 mt-6 pt-6 border-t border-border">
@@ -188,6 +198,12 @@ export function ResultsDashboard({ data, onReset }: ResultsDashboardProps) {
                         <p className="text-2xl font-bold text-danger">{unverifiedCount}</p>
                         <p className="text-text-muted text-xs mt-0.5">Unverified</p>
                     </div>
+                    {notCheckedCount > 0 && (
+                        <div className="text-center">
+                            <p className="text-2xl font-bold text-text-muted">{notCheckedCount}</p>
+                            <p className="text-text-muted text-xs mt-0.5">Not Checked</p>
+                        </div>
+                    )}
                 </div>
             </div>
 
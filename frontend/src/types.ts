@@ -18,6 +18,7 @@ export interface ClaimResult {
     score: number;
     evidence: Evidence[];
     explanation: string;
+    degraded?: boolean;
 }
 
 export interface VerificationResponse {
@@ -25,6 +26,7 @@ export interface VerificationResponse {
     overall_score: number;
     claims: ClaimResult[];
     resume_name: string;
+    degraded?: boolean;
 }
 
 export type ProgressStep = 'idle' | 'parsing' | 'extracting' | 'searching' | 'scoring' | 'complete' | 'error';